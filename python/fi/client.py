@@ -1,17 +1,22 @@
 import concurrent.futures as cf
 import copy
+import functools
 import os
+import threading
 import time
-from typing import Dict, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
 import uuid
+import weakref
 
-from requests_futures.sessions import FuturesSession
+import msgspec
+import urllib3
 
-from fi.bounded_executor import BoundedExecutor
 from fi.utils.constants import (
     API_KEY_ENVVAR_NAME,
+    MAX_FUTURE_SECONDS_FROM_CURRENT_TIME,
     MAX_FUTURE_YEARS_FROM_CURRENT_TIME,
     MAX_NUMBER_OF_EMBEDDINGS,
+    MAX_PAST_SECONDS_FROM_CURRENT_TIME,
     MAX_PAST_YEARS_FROM_CURRENT_TIME,
     MAX_PREDICTION_ID_LEN,
     MAX_TAG_LENGTH,
@@ -22,25 +27,32 @@ from fi.utils.constants import (
 )
 from fi.utils.errors import (
     AuthError,
+    BulkLogError,
     InvalidAdditionalHeaders,
     InvalidNumberOfEmbeddings,
     InvalidValueType,
 )
 from fi.utils.types import (
     CATEGORICAL_MODEL_TYPES,
+    ENVIRONMENT_VALUES,
+    MODEL_TYPE_VALUES,
     NUMERIC_MODEL_TYPES,
     Embedding,
     Environments,
+    LogRecord,
     ModelTypes,
     ObjectDetectionLabel,
     RankingActualLabel,
     RankingPredictionLabel,
     is_list_of,
 )
-from fi.utils.utils import convert_element, is_timestamp_in_range
+from fi.utils.utils import convert_element
 
 from .utils.logging import get_truncation_warning_message, logger
 
+if TYPE_CHECKING:
+    import aiohttp
+
 PredictionLabelTypes = Union[
     str,
     bool,
@@ -60,43 +72,339 @@ ActualLabelTypes = Union[
     RankingActualLabel,
 ]
 
+# Authentication headers set by the client, which additional_headers may not override
+_RESERVED_HEADER_KEYS = frozenset(("X-Api-Key", "X-Secret-Key"))
 
-class Client:
-    def __init__(
-        self,
-        api_key,
-        secret_key,
-        uri="http://localhost:8000",
-        max_workers=8,
-        max_queue_bound=5000,
-        timeout=200,
-        additional_headers=None,
-    ) -> None:
+
+class _BoundedExecutor:
+    """
+    Behaves as a ThreadPoolExecutor which will block on calls to submit() once "bound"
+    work items are queued for execution, so a fast producer cannot grow the backlog without
+    limit. The wait happens before ThreadPoolExecutor.submit, which holds locks shared by
+    every executor in the process.
+    :param bound: Integer - the maximum number of items waiting for a free worker, 0 means
+        submit() blocks whenever all workers are busy
+    :param max_workers: Integer - the size of the thread pool
+    """
+
+    def __init__(self, bound, max_workers):
+        if bound < 0:
+            raise ValueError(f"max_queue_bound must not be negative. Found {bound}")
+        self._executor = cf.ThreadPoolExecutor(max_workers=max_workers)
+        self._semaphore = threading.BoundedSemaphore(bound + max_workers)
+
+    def submit(self, fn, *args, **kwargs) -> cf.Future:
+        self._semaphore.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        future.add_done_callback(lambda _: self._semaphore.release())
+        return future
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait)
+
+
+def _flush_periodically(client_ref, closed, interval):
+    # Only holds a weak reference, so a client that is no longer used can still be
+    # garbage-collected; the thread exits with it or once the client is closed
+    while not closed.wait(interval):
+        client = client_ref()
+        if client is None:
+            return
+        try:
+            client.flush()
+        except Exception:
+            # The failure already reached the futures of the flushed records, keep
+            # flushing the ones queued after them
+            logger.exception("Failed to send queued bulk records")
+        del client
+
+
+def _send(pool, record, uri):
+    # Serialized inside the executor task so encoding errors come back through the
+    # returned future, like transport errors do
+    return pool.request(
+        "POST",
+        uri,
+        # body=MessageToDict(message=record, preserving_proto_field_name=True),
+        body=_ENCODER.encode(record),
+    )
+
+
+def _send_bulk(submit, pool, uri, batch) -> Optional[cf.Future]:
+    # Records whose future was cancelled while queued are dropped
+    batch = [
+        (record, future)
+        for record, future in batch
+        if future.set_running_or_notify_cancel()
+    ]
+    if not batch:
+        return None
+
+    futures = [future for _, future in batch]
+    try:
+        resp = submit(_send, pool, {"records": [record for record, _ in batch]}, uri)
+    except BaseException as exc:
+        for future in futures:
+            future.set_exception(exc)
+        raise
+    resp.add_done_callback(functools.partial(_resolve_bulk, futures))
+    return resp
+
+
+def _resolve_bulk(futures, bulk_future: cf.Future) -> None:
+    if bulk_future.cancelled():
+        exc = cf.CancelledError()
+    else:
+        exc = bulk_future.exception()
+    if exc is None:
+        resp = bulk_future.result()
+        try:
+            results = _bulk_results(resp, len(futures))
+        except BulkLogError as e:
+            exc = e
+    if exc is not None:
+        for future in futures:
+            future.set_exception(exc)
+        return
+
+    for i, (future, result) in enumerate(zip(futures, results)):
+        if isinstance(result, dict) and result.get("error"):
+            future.set_exception(
+                BulkLogError(f"Record {i} was rejected: {result['error']}", resp.status)
+            )
+        else:
+            future.set_result(result)
+
+
+def _bulk_results(resp, n_records) -> list:
+    if not 200 <= resp.status < 300:
+        raise BulkLogError("Bulk request failed", resp.status)
+    try:
+        body = msgspec.json.decode(resp.data)
+    except msgspec.DecodeError:
+        raise BulkLogError("Bulk response is not valid JSON", resp.status)
+    results = body.get("records") if isinstance(body, dict) else None
+    if not isinstance(results, list) or len(results) != n_records:
+        raise BulkLogError(
+            f'Bulk response must hold one entry per sent record ({n_records}) under "records"',
+            resp.status,
+        )
+    return results
+
+
+def _flush_orphaned(batch, batch_lock, executor, pool, uri):
+    # Finalizer of a Client, run when it is garbage-collected or at interpreter exit
+    with batch_lock:
+        pending = list(batch)
+        batch.clear()
+    if not pending:
+        return
+
+    def submit(fn, *args):
+        try:
+            return executor.submit(fn, *args)
+        except RuntimeError:
+            # The executor no longer accepts work at interpreter exit, send in this thread
+            future = cf.Future()
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args))
+            except BaseException as exc:
+                future.set_exception(exc)
+            return future
+
+    logger.warning(
+        f"Sending {len(pending)} bulk records left queued by a Client that was not closed"
+    )
+    try:
+        _send_bulk(submit, pool, uri, pending)
+    except Exception:
+        logger.exception("Failed to send queued bulk records")
+
+
+class _UuidPool:
+    """
+    Hands out random (version 4) UUIDs carved from one os.urandom read of n * 16 bytes,
+    so generating ids costs one getrandom syscall per n ids instead of one per id.
+    """
+
+    def __init__(self, n=1024):
+        self._n = n
+        self._buf = b""
+        self._i = 0
+        self._lock = threading.Lock()
+
+    def next(self) -> uuid.UUID:
+        with self._lock:
+            if self._i >= len(self._buf):
+                self._buf = os.urandom(16 * self._n)
+                self._i = 0
+            i = self._i
+            self._i += 16
+            raw = self._buf[i : i + 16]
+        return uuid.UUID(bytes=raw, version=4)
+
+    def reset(self):
+        # A forked child must not hand out the ids left in its parent's buffer
+        self._lock = threading.Lock()
+        self._buf = b""
+        self._i = 0
+
+
+_UUID_POOL = _UuidPool()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_UUID_POOL.reset)
+
+
+class _BaseClient:
+    """
+    Credentials, endpoints and record building shared by Client and AsyncClient, which
+    only differ in how records are sent.
+    """
+
+    def __init__(self, api_key, secret_key, uri, timeout, additional_headers) -> None:
         api_key = api_key or os.getenv(API_KEY_ENVVAR_NAME)
         secret_key = secret_key or os.getenv(SECRET_KEY_ENVVAR_NAME)
         if api_key is None or secret_key is None:
             raise AuthError(api_key, secret_key)
         self._uri_event = f"{uri}/log/event/"
         self._uri_model = f"{uri}/log/model/"
+        self._uri_model_bulk = f"{uri}/log/model/bulk/"
         self._timeout = timeout
-        self._session = FuturesSession(
-            executor=BoundedExecutor(max_queue_bound, max_workers)
-        )
+
+        if additional_headers is not None:
+            conflicting_keys = _RESERVED_HEADER_KEYS & additional_headers.keys()
+            if conflicting_keys:
+                raise InvalidAdditionalHeaders(conflicting_keys)
 
         self._headers = {
             "X-Api-Key": api_key,
             "X-Secret-Key": secret_key,
+            **(additional_headers or {}),
         }
 
-        if additional_headers is not None:
-            conflicting_keys = self._headers.keys() & additional_headers.keys()
-            if conflicting_keys:
-                raise InvalidAdditionalHeaders(conflicting_keys)
-            self._headers.update(additional_headers)
-
     def _now(self):
         return time.time()
 
+    def _model_record(
+        self,
+        model_id,
+        model_type,
+        environment,
+        model_version,
+        prediction_timestamp,
+        prediction_label,
+        actual_label,
+        features,
+        embedding_features,
+        tags,
+        batch_id,
+        validate,
+    ) -> LogRecord:
+        if validate:
+            _validate_log_args(
+                model_id,
+                model_type,
+                environment,
+                prediction_timestamp,
+                features,
+                embedding_features,
+                batch_id,
+            )
+
+        # Convert & Validate prediction_id
+        # Kept as a UUID object, msgspec writes it out in its canonical form without str()
+        prediction_id = _UUID_POOL.next() #_validate_and_convert_prediction_id(prediction_id)
+
+        # TODO:
+        p = prediction_label
+        a = actual_label
+
+        return LogRecord(
+            model_id=model_id,
+            model_type=MODEL_TYPE_VALUES[model_type],
+            environment=ENVIRONMENT_VALUES[environment],
+            model_version=model_version,
+            prediction_id=prediction_id,
+            prediction_timestamp=prediction_timestamp,
+            prediction_label=p,
+            actual_label=a,
+            features=features,
+            embedding_features=embedding_features,
+            tags=tags,
+            batch_id=batch_id,
+        )
+
+    def _event_record(
+        self, event_name, environment, prediction_id, event_timestamp, properties
+    ) -> dict:
+        return {
+            "prediction_id": prediction_id,
+            "event": event_name,
+            # Copied since the record is only serialized once the post actually runs
+            "properties": dict(properties) if properties else {},
+            "time": event_timestamp or self._now(),
+            "environment": ENVIRONMENT_VALUES[environment],
+        }
+
+    def _serialize(self, record) -> bytes:
+        return _ENCODER.encode(record)
+
+
+class Client(_BaseClient):
+    def __init__(
+        self,
+        api_key,
+        secret_key,
+        uri="http://localhost:8000",
+        max_workers=32,
+        max_queue_bound=None,
+        timeout=200,
+        additional_headers=None,
+        max_batch=100,
+        flush_interval=1.0,
+    ) -> None:
+        super().__init__(api_key, secret_key, uri, timeout, additional_headers)
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._batch = []
+        self._batch_lock = threading.Lock()
+        self._flush_thread = None
+        self._closed = threading.Event()
+
+        if max_queue_bound is None:
+            max_queue_bound = max_workers * 4
+        self._executor = _BoundedExecutor(max_queue_bound, max_workers)
+        # A single host pool keeping one keep-alive connection per worker, so steady-state
+        # posts skip the TCP/TLS handshake. Headers never change after init, so they are
+        # attached to the pool once instead of being passed on every request
+        self._pool = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=max_workers,
+            block=False,
+            headers={
+                **self._headers,
+                "Connection": "keep-alive",
+                "Content-Type": "application/json",
+            },
+            timeout=urllib3.Timeout(total=self._timeout),
+            retries=False,
+        )
+        # Only references the transport, so it does not keep the client alive
+        weakref.finalize(
+            self,
+            _flush_orphaned,
+            self._batch,
+            self._batch_lock,
+            self._executor,
+            self._pool,
+            self._uri_model_bulk,
+        )
+
     def log(
         self,
         model_id: str,
@@ -111,83 +419,25 @@ class Client:
         embedding_features: Optional[Dict[str, Embedding]] = None,
         tags: Optional[Dict[str, Union[str, bool, float, int]]] = None,
         batch_id: Optional[str] = None,
+        bulk: bool = False,
+        validate: bool = True,
     ) -> cf.Future:
-        if not isinstance(model_id, str):
-            raise InvalidValueType("model_id", model_id, "str")
-        if not isinstance(model_type, ModelTypes):
-            raise InvalidValueType("model_type", model_type, "fi.utils.ModelTypes")
-        # Validate environment
-        if not isinstance(environment, Environments):
-            raise InvalidValueType("environment", environment, "fi.utils.Environments")
-        if environment == Environments.VALIDATION:
-            if (
-                batch_id is None
-                or not isinstance(batch_id, str)
-                or len(batch_id.strip()) == 0
-            ):
-                raise ValueError(
-                    "Batch ID must be a nonempty string if logging to validation environment."
-                )
-
-        # Convert & Validate prediction_id
-        prediction_id = str(uuid.uuid4()) #_validate_and_convert_prediction_id(prediction_id)
-
-        # Validate feature types
-        if features:
-            if not isinstance(features, dict):
-                raise InvalidValueType("features", features, "dict")
-
-        # Validate embedding_features type
-        if embedding_features:
-            if not isinstance(embedding_features, dict):
-                raise InvalidValueType("embedding_features", embedding_features, "dict")
-            if len(embedding_features) > MAX_NUMBER_OF_EMBEDDINGS:
-                raise InvalidNumberOfEmbeddings(len(embedding_features))
-
-        # Check the timestamp present on the event
-        if prediction_timestamp is not None:
-            if not isinstance(prediction_timestamp, int):
-                raise InvalidValueType(
-                    "prediction_timestamp", prediction_timestamp, "int"
-                )
-            # Send warning if prediction is sent with future timestamp
-            now = int(time.time())
-            if prediction_timestamp > now:
-                logger.warning(
-                    "Caution when sending a prediction with future timestamp."
-                    "fi only stores 2 years worth of data. For example, if you sent a prediction "
-                    "to fi from 1.5 years ago, and now send a prediction with timestamp of a year in "
-                    "the future, the oldest 0.5 years will be dropped to maintain the 2 years worth of data "
-                    "requirement."
-                )
-            if not is_timestamp_in_range(now, prediction_timestamp):
-                raise ValueError(
-                    f"prediction_timestamp: {prediction_timestamp} is out of range."
-                    f"Prediction timestamps must be within {MAX_FUTURE_YEARS_FROM_CURRENT_TIME} year in the "
-                    f"future and {MAX_PAST_YEARS_FROM_CURRENT_TIME} years in the past from the current time."
-                )
-
-                # Construct the prediction
-
-        # TODO:
-        p = prediction_label
-        a = actual_label
-
-        record = {
-            "model_id": model_id,
-            "model_type": model_type.value,
-            "environment": environment.value,
-            "model_version": model_version,
-            "prediction_id": prediction_id,
-            "prediction_timestamp": prediction_timestamp,
-            "prediction_label": p,
-            "actual_label": a,
-            "features": features,
-            "embedding_features": embedding_features,
-            "tags": tags,
-            "batch_id": batch_id,
-        }
-
+        record = self._model_record(
+            model_id,
+            model_type,
+            environment,
+            model_version,
+            prediction_timestamp,
+            prediction_label,
+            actual_label,
+            features,
+            embedding_features,
+            tags,
+            batch_id,
+            validate,
+        )
+        if bulk:
+            return self._enqueue(record)
         return self._post(record=record, uri=self._uri_model, indexes=None)
 
     def track(
@@ -198,37 +448,263 @@ class Client:
         event_timestamp: Optional[int] = None,
         properties=None,
     ) -> cf.Future:
-        all_properties = {
-            # 'mp_lib': 'python',
-            # '$lib_version': __version__,
-        }
+        record = self._event_record(
+            event_name, environment, prediction_id, event_timestamp, properties
+        )
+        return self._post(record=record, uri=self._uri_event, indexes=None)
 
-        if properties:
-            all_properties.update(properties)
+    def flush(self) -> Optional[cf.Future]:
+        """
+        Sends every record queued by log(bulk=True) in a single POST. Queued records are
+        also flushed once max_batch of them accumulate, every flush_interval seconds and
+        by close(), so this rarely needs to be called explicitly.
 
-        record = {
-            "prediction_id": prediction_id,
-            "event": event_name,
-            "properties": all_properties,
-            "time": event_timestamp or self._now(),
-            "environment": environment.value,
-        }
+        The bulk endpoint must answer with {"records": [...]} holding one result per sent
+        record, in order. The future of each record resolves with its own entry, or fails
+        with BulkLogError if that entry has an "error", the request got a non-2xx status or
+        the response is malformed.
 
-        return self._post(record=record, uri=self._uri_event, indexes=None)
+        Returns:
+        --------
+            The future of the bulk request, or None if nothing was queued
+        """
+        with self._batch_lock:
+            # Emptied in place, the finalizer registered in __init__ holds this same list
+            batch = list(self._batch)
+            self._batch.clear()
+        return _send_bulk(self._executor.submit, self._pool, self._uri_model_bulk, batch)
+
+    def _enqueue(self, record) -> cf.Future:
+        # Each queued record gets its own future, resolved from its entry in the response
+        # of the bulk request that carried it
+        future = cf.Future()
+        with self._batch_lock:
+            if self._closed.is_set():
+                raise RuntimeError("cannot log to a closed Client")
+            self._batch.append((record, future))
+            full = len(self._batch) >= self._max_batch
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=_flush_periodically,
+                    args=(weakref.ref(self), self._closed, self._flush_interval),
+                    daemon=True,
+                )
+                self._flush_thread.start()
+        if full:
+            self.flush()
+        return future
+
+    def close(self) -> None:
+        """
+        Stops the periodic flush, sends the records still queued by log(bulk=True) and
+        waits for every pending request to complete. The client cannot be used afterwards.
+        Records left queued by a client that is garbage-collected or still open at
+        interpreter exit are sent by a finalizer, close() makes that explicit.
+        """
+        with self._batch_lock:
+            self._closed.set()
+            flush_thread = self._flush_thread
+        if flush_thread is not None:
+            flush_thread.join()
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self._pool.clear()
 
     def _post(self, record, uri, indexes):
-        resp = self._session.post(
-            uri,
-            headers=self._headers,
-            timeout=self._timeout,
-            # json=MessageToDict(message=record, preserving_proto_field_name=True),
-            json=record,
+        resp = self._executor.submit(_send, self._pool, record, uri)
+        if indexes is not None and len(indexes) == 2:
+            resp.starting_index = indexes[0]
+            resp.ending_index = indexes[1]
+        return resp
+
+
+class AsyncClient(_BaseClient):
+    """
+    Asynchronous counterpart of Client. All records go through a single connection-pooled
+    aiohttp session driven by the caller's event loop, so log() and track() are coroutines
+    resolving to the aiohttp response. Bulk logging is not supported. Requires the "async"
+    extra (aiohttp).
+
+    The session is bound to the loop it is first used in; call close() (or use the client
+    as an async context manager) before that loop is shut down.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        secret_key,
+        uri="http://localhost:8000",
+        max_workers=8,
+        timeout=200,
+        keepalive_timeout=15,
+        additional_headers=None,
+    ) -> None:
+        super().__init__(api_key, secret_key, uri, timeout, additional_headers)
+        self._max_workers = max_workers
+        self._keepalive_timeout = keepalive_timeout
+        # aiohttp sessions must be created inside a running loop, see _get_session
+        self._session = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._max_workers,
+                    keepalive_timeout=self._keepalive_timeout,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                headers={**self._headers, "Content-Type": "application/json"},
+            )
+        return self._session
+
+    async def log(
+        self,
+        model_id: str,
+        model_type: ModelTypes,
+        environment: Environments,
+        model_version: Optional[str] = None,
+        prediction_timestamp: Optional[int] = None,
+        prediction_label: Optional[PredictionLabelTypes] = None,
+        actual_label: Optional[ActualLabelTypes] = None,
+        features: Optional[Dict[str, Union[str, bool, float, int]]] = None,
+        embedding_features: Optional[Dict[str, Embedding]] = None,
+        tags: Optional[Dict[str, Union[str, bool, float, int]]] = None,
+        batch_id: Optional[str] = None,
+        validate: bool = True,
+    ) -> "aiohttp.ClientResponse":
+        record = self._model_record(
+            model_id,
+            model_type,
+            environment,
+            model_version,
+            prediction_timestamp,
+            prediction_label,
+            actual_label,
+            features,
+            embedding_features,
+            tags,
+            batch_id,
+            validate,
         )
+        return await self._post(record=record, uri=self._uri_model, indexes=None)
+
+    async def track(
+        self,
+        event_name,
+        environment: Environments,
+        prediction_id=None,
+        event_timestamp: Optional[int] = None,
+        properties=None,
+    ) -> "aiohttp.ClientResponse":
+        record = self._event_record(
+            event_name, environment, prediction_id, event_timestamp, properties
+        )
+        return await self._post(record=record, uri=self._uri_event, indexes=None)
+
+    async def _post(self, record, uri, indexes):
+        resp = await self._get_session().post(uri, data=self._serialize(record))
+        # Reading the whole body returns the connection to the pool and caches the body, so
+        # read()/json() keep working on the returned response. Leaving an "async with" block
+        # would release it explicitly instead, after which aiohttp refuses to return the body
+        try:
+            await resp.read()
+        except BaseException:
+            resp.close()
+            raise
         if indexes is not None and len(indexes) == 2:
             resp.starting_index = indexes[0]
             resp.ending_index = indexes[1]
         return resp
 
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+def _enc_hook(obj):
+    # numpy arrays and scalars, pandas objects
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Label and embedding NamedTuples are encoded as arrays, like the stdlib json module does
+_ENCODER = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+def _validate_log_args(
+    model_id,
+    model_type,
+    environment,
+    prediction_timestamp,
+    features,
+    embedding_features,
+    batch_id,
+) -> None:
+    if not isinstance(model_id, str):
+        raise InvalidValueType("model_id", model_id, "str")
+    if not isinstance(model_type, ModelTypes):
+        raise InvalidValueType("model_type", model_type, "fi.utils.ModelTypes")
+    # Validate environment
+    if not isinstance(environment, Environments):
+        raise InvalidValueType("environment", environment, "fi.utils.Environments")
+    if environment == Environments.VALIDATION:
+        if (
+            batch_id is None
+            or not isinstance(batch_id, str)
+            or len(batch_id.strip()) == 0
+        ):
+            raise ValueError(
+                "Batch ID must be a nonempty string if logging to validation environment."
+            )
+
+    # Validate feature types
+    if features:
+        if not isinstance(features, dict):
+            raise InvalidValueType("features", features, "dict")
+
+    # Validate embedding_features type
+    if embedding_features:
+        if not isinstance(embedding_features, dict):
+            raise InvalidValueType("embedding_features", embedding_features, "dict")
+        if len(embedding_features) > MAX_NUMBER_OF_EMBEDDINGS:
+            raise InvalidNumberOfEmbeddings(len(embedding_features))
+
+    # Check the timestamp present on the event
+    if prediction_timestamp is not None:
+        if not isinstance(prediction_timestamp, int):
+            raise InvalidValueType(
+                "prediction_timestamp", prediction_timestamp, "int"
+            )
+        # Send warning if prediction is sent with future timestamp
+        now = int(time.time())
+        if prediction_timestamp > now:
+            logger.warning(
+                "Caution when sending a prediction with future timestamp."
+                "fi only stores 2 years worth of data. For example, if you sent a prediction "
+                "to fi from 1.5 years ago, and now send a prediction with timestamp of a year in "
+                "the future, the oldest 0.5 years will be dropped to maintain the 2 years worth of data "
+                "requirement."
+            )
+        if not (
+            now - MAX_PAST_SECONDS_FROM_CURRENT_TIME
+            <= prediction_timestamp
+            <= now + MAX_FUTURE_SECONDS_FROM_CURRENT_TIME
+        ):
+            raise ValueError(
+                f"prediction_timestamp: {prediction_timestamp} is out of range."
+                f"Prediction timestamps must be within {MAX_FUTURE_YEARS_FROM_CURRENT_TIME} year in the "
+                f"future and {MAX_PAST_YEARS_FROM_CURRENT_TIME} years in the past from the current time."
+            )
+
 
 def _convert_prediction_id(prediction_id: Union[str, int, float]) -> str:
     if not isinstance(prediction_id, str):
@@ -10,6 +10,9 @@ MAX_TAG_LENGTH_TRUNCATION = 1_000
 
 MAX_PAST_YEARS_FROM_CURRENT_TIME = 5
 MAX_FUTURE_YEARS_FROM_CURRENT_TIME = 1
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+MAX_PAST_SECONDS_FROM_CURRENT_TIME = MAX_PAST_YEARS_FROM_CURRENT_TIME * SECONDS_PER_YEAR
+MAX_FUTURE_SECONDS_FROM_CURRENT_TIME = MAX_FUTURE_YEARS_FROM_CURRENT_TIME * SECONDS_PER_YEAR
 
 MAX_RAW_DATA_CHARACTERS = 50_000
 MAX_RAW_DATA_CHARACTERS_TRUNCATION = 5_000
@@ -90,4 +90,20 @@ class InvalidValueType(Exception):
         return (
             f"{self.value_name} with value {self.value} is of type {type(self.value).__name__}, "
             f"but expected {self.correct_type}"
-        )
\ No newline at end of file
+        )
+
+class BulkLogError(Exception):
+    def __init__(self, reason: str, status: Optional[int] = None) -> None:
+        self.reason = reason
+        self.status = status
+
+    def __repr__(self) -> str:
+        return "Bulk_Log_Error"
+
+    def __str__(self) -> str:
+        return self.error_message()
+
+    def error_message(self) -> str:
+        if self.status is None:
+            return self.reason
+        return f"{self.reason} (HTTP status {self.status})"
@@ -1,13 +1,26 @@
 from enum import Enum, unique
-from typing import List, NamedTuple, Optional, Sequence, TypeVar, Union
+from itertools import repeat
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Sequence, TypeVar, Union
+import uuid
 
-import pandas as pd
+import msgspec
 from fi.utils.logging import get_truncation_warning_message, logger
 
-import numpy as np
-
 from fi.utils.constants import MAX_RAW_DATA_CHARACTERS, MAX_RAW_DATA_CHARACTERS_TRUNCATION
 
+# numpy and pandas are imported lazily, they dominate the import time of the client
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Element types accepted in embedding vectors given as plain lists, the numpy ones are
+# added by _embedding_scalar_types once numpy is loaded
+_PYTHON_SCALAR_TYPES = (int, float)
+_ALLOWED_EMBEDDING_SCALAR_TYPES = None
+# dtype kinds (signed int, unsigned int, float) accepted for array-backed embedding vectors
+_NUMERIC_DTYPE_KINDS = ("i", "u", "f")
+
 
 @unique
 class ModelTypes(Enum):
@@ -30,6 +43,9 @@ class ModelTypes(Enum):
         return [t.name for t in cls]
 
 
+# Plain dict lookups, cheaper than going through the Enum .value descriptor on every record
+MODEL_TYPE_VALUES = {t: t.value for t in ModelTypes}
+
 NUMERIC_MODEL_TYPES = [ModelTypes.NUMERIC, ModelTypes.REGRESSION]
 CATEGORICAL_MODEL_TYPES = [
     ModelTypes.SCORE_CATEGORICAL,
@@ -42,7 +58,26 @@ class Environments(Enum):
     VALIDATION = 2
     PRODUCTION = 3
     CORPUS = 4
-    
+
+
+ENVIRONMENT_VALUES = {e: e.value for e in Environments}
+
+
+class LogRecord(msgspec.Struct):
+    """Body of a single model log request, encoded straight to JSON by msgspec"""
+
+    model_id: str
+    model_type: int
+    environment: int
+    model_version: Optional[str] = None
+    prediction_id: Optional[uuid.UUID] = None
+    prediction_timestamp: Optional[int] = None
+    prediction_label: Any = None
+    actual_label: Any = None
+    features: Optional[Dict[str, Any]] = None
+    embedding_features: Optional[Dict[str, Any]] = None
+    tags: Optional[Dict[str, Any]] = None
+    batch_id: Optional[str] = None
 
 
 class ObjectDetectionLabel(NamedTuple):
@@ -74,16 +109,18 @@ class ObjectDetectionLabel(NamedTuple):
                     "Each bounding box's coordinates must be a collection of 4 floats. Found "
                     f"{coordinates}"
                 )
-            if any(coord < 0 for coord in coordinates):
+            x_min, y_min, x_max, y_max = coordinates
+            # Checked directly, a generator over 4 values costs more than the comparisons
+            if x_min < 0 or y_min < 0 or x_max < 0 or y_max < 0:
                 raise ValueError(
                     f"Bounding box's coordinates cannot be negative. Found {coordinates}"
                 )
-            if not (coordinates[2] > coordinates[0]):
+            if not (x_max > x_min):
                 raise ValueError(
                     "Each bounding box bottom-right X coordinate should be larger than the "
                     f"top-left. Found {coordinates}"
                 )
-            if not (coordinates[3] > coordinates[1]):
+            if not (y_max > y_min):
                 raise ValueError(
                     "Each bounding box bottom-right Y coordinate should be larger than the "
                     f"top-left. Found {coordinates}"
@@ -267,9 +304,19 @@ class Embedding(NamedTuple):
                 f"list, "
                 f"np.ndarray or pd.Series"
             )
-        # Fail if not all elements in list are floats
-        allowed_types = (int, float, np.int16, np.int32, np.float16, np.float32)
-        if not all(isinstance(val, allowed_types) for val in self.vector):  # type: ignore
+        # Fail if not all elements in list are floats. 1-d arrays and Series with a numeric
+        # dtype are valid as a whole, everything else needs a per-element check
+        is_numeric_array = (
+            isinstance(self.vector, _loaded_array_types())
+            and self.vector.ndim == 1
+            # pandas extension dtypes such as Int64 report a numeric kind but can hold pd.NA
+            and isinstance(self.vector.dtype, sys.modules["numpy"].dtype)
+            and self.vector.dtype.kind in _NUMERIC_DTYPE_KINDS
+        )
+        allowed_types = _embedding_scalar_types()
+        if not is_numeric_array and not all(
+            isinstance(val, allowed_types) for val in self.vector  # type: ignore
+        ):
             raise TypeError(
                 f"Embedding vector must be a vector of integers and/or floats. Got "
                 f"{emb_name}.vector = {self.vector}"
@@ -347,7 +394,9 @@ class Embedding(NamedTuple):
             )
 
     @staticmethod
-    def _is_valid_iterable(data: Union[str, List[str], List[float], np.ndarray, pd.Series]) -> bool:
+    def _is_valid_iterable(
+        data: Union[str, List[str], List[float], "np.ndarray", "pd.Series"]
+    ) -> bool:
         """
         Validates that the input data field is of the correct iterable type. That is:
             1. List or
@@ -362,18 +411,45 @@ class Embedding(NamedTuple):
         --------
             True if the data type is one of the accepted iterable types, false otherwise
         """
-        return any(isinstance(data, t) for t in (list, np.ndarray, pd.Series))
+        return isinstance(data, list) or isinstance(data, _loaded_array_types())
+
+
+def _loaded_array_types() -> tuple:
+    # A value can only be a numpy array or pandas Series if the caller already imported the
+    # library, so checking sys.modules avoids importing either one just to run isinstance
+    types = []
+    np = sys.modules.get("numpy")
+    if np is not None:
+        types.append(np.ndarray)
+    pd = sys.modules.get("pandas")
+    if pd is not None:
+        types.append(pd.Series)
+    return tuple(types)
+
+
+def _embedding_scalar_types() -> tuple:
+    # Before numpy is loaded a list cannot hold numpy scalars, so there is nothing to cache
+    global _ALLOWED_EMBEDDING_SCALAR_TYPES
+    if _ALLOWED_EMBEDDING_SCALAR_TYPES is None:
+        np = sys.modules.get("numpy")
+        if np is None:
+            return _PYTHON_SCALAR_TYPES
+        # Matches the dtypes accepted for arrays, np.float64 already subclasses float
+        _ALLOWED_EMBEDDING_SCALAR_TYPES = _PYTHON_SCALAR_TYPES + (
+            np.signedinteger,
+            np.unsignedinteger,
+            np.floating,
+        )
+    return _ALLOWED_EMBEDDING_SCALAR_TYPES
 
 
 T = TypeVar("T", bound=type)
 
 def is_list_of(lst: Sequence[object], tp: T) -> bool:
-    return isinstance(lst, list) and all(isinstance(x, tp) for x in lst)
+    # map(isinstance, ...) keeps the per-element loop in C, without a generator frame
+    return isinstance(lst, list) and all(map(isinstance, lst, repeat(tp)))
 
 def count_characters_raw_data(data: Union[str, List[str]]) -> int:
-    character_count = 0
     if isinstance(data, str):
         return len(data)
-    for string in data:
-        character_count += len(string)
-    return character_count
\ No newline at end of file
+    return sum(map(len, data))
\ No newline at end of file
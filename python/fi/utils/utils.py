@@ -1,21 +1,24 @@
 
 
-import pandas as pd
+# Exact types only: subclasses such as np.float64 still need converting to the native type
+_NATIVE_SCALAR_TYPES = frozenset((str, bool, int))
 
-from fi.utils.constants import MAX_FUTURE_YEARS_FROM_CURRENT_TIME, MAX_PAST_YEARS_FROM_CURRENT_TIME
-
-def is_timestamp_in_range(now: int, ts: int):
-    max_time = now + (MAX_FUTURE_YEARS_FROM_CURRENT_TIME * 365 * 24 * 60 * 60)
-    min_time = now - (MAX_PAST_YEARS_FROM_CURRENT_TIME * 365 * 24 * 60 * 60)
-    return min_time <= ts <= max_time
 
 def convert_element(value):
     """converts scalar or array to python native"""
-    val = getattr(value, "tolist", lambda: value)()
+    # Native scalars skip the tolist lookup and pandas NA dispatch, only float NaN maps to None
+    if value is None or type(value) in _NATIVE_SCALAR_TYPES:
+        return value
+    if type(value) is float:
+        return None if value != value else value
+    val = value.tolist() if hasattr(value, "tolist") else value
     # Check if it's a list since elements from pd indices are converted to a scalar
     # whereas pd series/dataframe elements are converted to list of 1 with the native value
     if isinstance(val, list):
         val = val[0] if val else None
+    # Imported here to keep pandas out of the client's import time
+    import pandas as pd
+
     if pd.isna(val):
         return None
     return val
@@ -1,12 +1,15 @@
 from setuptools import setup, find_packages
 
 def get_requirements(path: str):
-    return [l.strip() for l in open(path)]
+    with open(path) as f:
+        return [l.strip() for l in f if l.strip() and not l.startswith("#")]
 
 setup(
     name='fi',
     version='0.0.1',
     packages=find_packages(),
     install_requires=get_requirements("requirements.txt"),
-    python_requires='>=3.6'
+    # AsyncClient is the only user of aiohttp
+    extras_require={"async": ["aiohttp"]},
+    python_requires='>=3.9'
 )
\ No newline at end of file